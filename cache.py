@@ -0,0 +1,108 @@
+import hashlib
+import json
+import sqlite3
+import time
+import unicodedata
+
+import numpy as np
+
+
+def normalize_text(text):
+    """NFC-normalize and strip text so equivalent inputs hash identically."""
+    return unicodedata.normalize("NFC", text or "").strip()
+
+
+def hash_request(model, prompt, doc_text):
+    """Return the SHA-256 cache key for a (model, prompt, document) request."""
+    payload = "|".join(normalize_text(part) for part in (model, prompt, doc_text))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Exact-match cache of parsed LLM responses, persisted in SQLite.
+
+    The connection may be used from a thread other than the one that opened
+    it, but only from one thread at a time.
+    """
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB, ts REAL)"
+        )
+        self.conn.commit()
+
+    def get(self, key):
+        row = self.conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, ts) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time())
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class SemanticCache:
+    """Near-duplicate cache: reuses the answer of the most similar previously seen document.
+
+    Embeddings of the first ``prefix_length`` characters are searched with a FAISS
+    inner-product index; vectors are L2-normalized so scores are cosine similarities.
+    Like ``ResponseCache``, it must only be used from one thread at a time.
+
+    faiss and sentence-transformers (torch) are imported here rather than at
+    module level, so importing this module for ``ResponseCache`` stays cheap.
+    """
+
+    def __init__(self, path, model_name="all-MiniLM-L6-v2", threshold=0.92, prefix_length=2000):
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.prefix_length = prefix_length
+        self.index = faiss.IndexFlatIP(self.model.get_sentence_embedding_dimension())
+        self.values = []
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_responses (id INTEGER PRIMARY KEY, vec BLOB, value BLOB, ts REAL)"
+        )
+        self.conn.commit()
+
+        rows = self.conn.execute("SELECT vec, value FROM semantic_responses ORDER BY id").fetchall()
+        if rows:
+            self.index.add(np.vstack([np.frombuffer(vec, dtype=np.float32) for vec, _ in rows]))
+            self.values = [json.loads(value) for _, value in rows]
+
+    def embed(self, doc_texts):
+        """Embed several documents in one call; returns an ``(n, dim)`` float32 array."""
+        texts = [normalize_text(doc_text)[:self.prefix_length] for doc_text in doc_texts]
+        vecs = self.model.encode(texts, normalize_embeddings=True)
+        return np.asarray(vecs, dtype=np.float32)
+
+    def get(self, vec):
+        if self.index.ntotal == 0:
+            return None
+        scores, ids = self.index.search(vec, 1)
+        if scores[0][0] <= self.threshold:
+            return None
+        return self.values[ids[0][0]]
+
+    def set(self, vec, value):
+        self.index.add(vec)
+        self.values.append(value)
+        self.conn.execute(
+            "INSERT INTO semantic_responses (vec, value, ts) VALUES (?, ?, ?)",
+            (vec.tobytes(), json.dumps(value), time.time())
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,64 @@
+import re
+import zipfile
+
+from lxml import etree
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W_P = f"{{{W_NS}}}p"
+W_T = f"{{{W_NS}}}t"
+
+# Paragraphs kept besides the header block: the headings the prompt asks
+# about, each followed by a few paragraphs of context.
+HEADER_PARAGRAPHS = 20
+CONTEXT_PARAGRAPHS = 3
+_KEY_SECTION_RE = re.compile(r"\b(scope of audit|period of audit|reporting period|department|state)\b", re.IGNORECASE)
+
+
+def iter_paragraph_texts(doc_path):
+    """Yield the text of each paragraph in a .docx file.
+
+    Streams ``word/document.xml`` straight from the zip with ``iterparse``,
+    collecting ``w:t`` nodes per paragraph instead of building python-docx
+    ``Paragraph`` objects. Parsing stops as soon as the caller stops iterating.
+    """
+    with zipfile.ZipFile(doc_path) as zf, zf.open("word/document.xml") as xml:
+        parts = []
+        for _, elem in etree.iterparse(xml, events=("end",), tag=(W_T, W_P)):
+            if elem.tag == W_T:
+                parts.append(elem.text or "")
+                continue
+            yield "".join(parts)
+            parts = []
+            elem.clear()
+
+
+def extract_text_from_docx(doc_path, max_length):
+    """Return ``(text, truncated, error)`` for the informative paragraphs of a .docx file.
+
+    Only the header block and paragraphs around the key audit headings are
+    kept, so the length budget is not spent on tables of contents and
+    signature blocks.
+
+    This runs inside worker processes, so failures are reported back to the
+    caller for logging instead of being raised or logged here.
+    """
+    try:
+        lines, total, truncated = [], 0, False
+        index, keep_until = 0, HEADER_PARAGRAPHS
+        for text in iter_paragraph_texts(doc_path):
+            text = text.strip()
+            if not text:
+                continue
+            if _KEY_SECTION_RE.search(text):
+                keep_until = max(keep_until, index + CONTEXT_PARAGRAPHS + 1)
+            index += 1
+            if index > keep_until:
+                continue
+            lines.append(text)
+            total += len(text) + 1
+            if total > max_length:
+                truncated = True
+                break
+        return "\n".join(lines)[:max_length], truncated, None
+    except Exception as e:
+        return "", False, str(e)
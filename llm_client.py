@@ -0,0 +1,42 @@
+import logging
+
+from aiolimiter import AsyncLimiter
+from groq import APIConnectionError, InternalServerError, RateLimitError
+from langchain_groq import ChatGroq
+from tenacity import AsyncRetrying, before_sleep_log, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+
+class GroqClient:
+    """ChatGroq wrapper that owns retrying and QPM throttling for every request.
+
+    The groq client's own retries are disabled so that every HTTP call goes
+    through the rate limiter and every retry is logged; the retried errors are
+    the ones the client would otherwise have retried itself: 429s, connection
+    errors and timeouts (``APITimeoutError`` subclasses ``APIConnectionError``)
+    and 5xx responses.
+    """
+
+    def __init__(self, model, requests_per_minute, max_retries, logger):
+        self.llm = ChatGroq(model=model, max_retries=0)
+        self.rate_limiter = AsyncLimiter(requests_per_minute, 60)
+        self.max_retries = max_retries
+        self.logger = logger
+
+    async def query(self, system_prompt, user_content, sem):
+        """Return the response text; re-raises the last error once retries are exhausted."""
+        async for attempt in AsyncRetrying(
+            wait=wait_exponential_jitter(initial=1, max=30),
+            stop=stop_after_attempt(self.max_retries),
+            retry=retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
+            before_sleep=before_sleep_log(self.logger, logging.WARNING),
+            reraise=True
+        ):
+            with attempt:
+                async with sem, self.rate_limiter:
+                    response = await self.llm.ainvoke([
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content}
+                    ])
+        content = response.content.strip()
+        self.logger.info("Received raw response from Groq API: %s", content)
+        return content
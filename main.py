@@ -1,199 +1,433 @@
 import os
 import re
-import json
+import orjson
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 import pandas as pd
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 from dotenv import load_dotenv
-from docx import Document
-from langchain_groq import ChatGroq
+from cache import ResponseCache, SemanticCache, hash_request
+from docx_extract import extract_text_from_docx
 import logging
 from logging.handlers import RotatingFileHandler
 
+# ====== CONFIGURATION ======
 LOG_FILE = r"C:/Users/Soumy/OneDrive/Desktop/IR/script.log"
+MY_DOCS_FOLDER = r"C:/Users/Soumy/OneDrive/Desktop/IR/input"
+RESULTS_FILE = r"C:/Users/Soumy/OneDrive/Desktop/IR/results.xlsx"
+CHECKPOINT_FILE = r"C:/Users/Soumy/OneDrive/Desktop/IR/results.jsonl"
+CACHE_FILE = r"C:/Users/Soumy/OneDrive/Desktop/IR/cache.sqlite"
+MODEL = "qwen/qwen3-32b"
+#MODEL = "DeepSeek-R1-Distill-Llama-70B"
+MAX_TEXT_LENGTH = 2000
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92  # cosine similarity above which a previous answer is reused
+BATCH_SIZE = 8  # documents per Groq request; BATCH_SIZE * MAX_TEXT_LENGTH must fit the model context
+MAX_CONCURRENT_REQUESTS = 16  # keep at or below the Groq account's rate limit
+REQUESTS_PER_MINUTE = 60  # Groq QPM tier for MODEL
+MAX_RETRIES = 5
+RESULT_COLUMNS = ["Filename", "State", "Location", "Department", "Audit Conducted Year", "Financial Year"]
+
+# Handlers, environment and the LLM client are set up by the parent process
+# only: on Windows every spawned parsing worker re-imports this module, so
+# the LLM libraries and torch (via SemanticCache) are imported lazily too.
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
 
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+def setup_logging():
+    logger.setLevel(logging.INFO)
 
-file_handler = RotatingFileHandler(LOG_FILE, maxBytes=5*1024*1024, backupCount=3)
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
-logger.handlers = []
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=5*1024*1024, backupCount=3, delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
-logger.info("Script started at %s", pd.Timestamp.now(tz='Asia/Kolkata').strftime('%Y-%m-%d %H:%M:%S %Z'))
+    logger.handlers = []
+    logger.addHandler(console_handler)
+    logger.addHandler(file_handler)
 
-load_dotenv()
+    logger.info("Script started at %s", pd.Timestamp.now(tz='Asia/Kolkata').strftime('%Y-%m-%d %H:%M:%S %Z'))
 
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-if not GROQ_API_KEY:
-    logger.error("GROQ_API_KEY not found in .env file. Please set it.")
-    raise ValueError("GROQ_API_KEY environment variable is not set.")
+def init_llm():
+    load_dotenv()
 
-# ====== CONFIGURATION ======
-MY_DOCS_FOLDER = r"C:/Users/Soumy/OneDrive/Desktop/IR/input"
-RESULTS_FILE = r"C:/Users/Soumy/OneDrive/Desktop/IR/results.xlsx"
-MODEL = "qwen/qwen3-32b"
-#MODEL = "DeepSeek-R1-Distill-Llama-70B"
-MAX_TEXT_LENGTH = 5000
+    if not os.getenv("GROQ_API_KEY"):
+        logger.error("GROQ_API_KEY not found in .env file. Please set it.")
+        raise ValueError("GROQ_API_KEY environment variable is not set.")
 
-if not os.path.exists(MY_DOCS_FOLDER):
-    logger.error(f"Directory {MY_DOCS_FOLDER} does not exist.")
-    raise FileNotFoundError(f"Directory {MY_DOCS_FOLDER} does not exist.")
+    # Initialize ChatGroq model
+    try:
+        from llm_client import GroqClient
+        llm = GroqClient(MODEL, REQUESTS_PER_MINUTE, MAX_RETRIES, logger)
+        logger.info(f"Initialized ChatGroq model: {MODEL}")
+        return llm
+    except Exception as e:
+        logger.error(f"Failed to initialize ChatGroq model: {str(e)}")
+        raise
 
-# Initialize ChatGroq model
-try:
-    llm = ChatGroq(model=MODEL)
-    logger.info(f"Initialized ChatGroq model: {MODEL}")
-except Exception as e:
-    logger.error(f"Failed to initialize ChatGroq model: {str(e)}")
-    raise
+_LOC_RE = re.compile(r"\b(highway|road|street|main|lane)\b.*", re.IGNORECASE)
+_DEPARTMENT_SUFFIX_RE = re.compile(r"\s*department$", re.IGNORECASE)
 
 # ---------- UTILITIES ----------
-def extract_text_from_docx(doc_path):
-    try:
-        doc = Document(doc_path)
-        lines = [para.text.strip() for para in doc.paragraphs if para.text.strip()]
-        extracted_text = "\n".join(lines)
-        if len(extracted_text) > MAX_TEXT_LENGTH:
-            extracted_text = extracted_text[:MAX_TEXT_LENGTH]
-            logger.warning(f"Text from {doc_path} truncated to {MAX_TEXT_LENGTH} characters")
-        return extracted_text
-    except Exception as e:
-        logger.error(f"Error reading {doc_path}: {str(e)}")
-        return ""
+def iter_docx(root):
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_docx(entry.path)
+            elif entry.name.lower().endswith(".docx"):
+                yield entry.path
+
+async def extract_texts(pool, fpaths):
+    """Parse documents in the process pool; DOCX parsing is CPU-bound and holds the GIL."""
+    loop = asyncio.get_running_loop()
+    extract = partial(extract_text_from_docx, max_length=MAX_TEXT_LENGTH)
+    results = await asyncio.gather(*[loop.run_in_executor(pool, extract, fpath) for fpath in fpaths])
+
+    texts = []
+    for fpath, (text, truncated, error) in zip(fpaths, results):
+        if error:
+            logger.error(f"Error reading {fpath}: {error}")
+        elif truncated:
+            logger.warning(f"Text from {fpath} truncated to {MAX_TEXT_LENGTH} characters")
+        texts.append(text)
+    return texts
 
 def clean_location(location):
     if not location:
         return ""
     if "," in location:
         return location.split(",")[-1].strip()
-    location = re.sub(r"\b(highway|road|street|main|lane)\b.*", "", location, flags=re.IGNORECASE).strip()
+    location = _LOC_RE.sub("", location).strip()
     return location
 
-def analyze_ir_content(doc_text):
-    if not doc_text:
-        return "Unknown", "Unknown", "Unknown Department", "Unknown", "Unknown"
+FIELD_RULES = (
+"""Identify from the IR file:
+- State: name of the Indian state ('Unknown' if not found).
+- Location: clean town/city/taluka name, not a full address ('Unknown' if not found).
+- Department: one overall department, always ending with 'Department' ('Unknown Department' if not found).
+- Audit Conducted Year: the Date of Audit from the Scope of Audit section ('Unviable' if not found; 'DD-MM-YYYY' or 'YYYY-YYYY' when possible).
+- Financial Year: the Period of Audit / Reporting Period from the headings or Scope of Audit section ('Unviable' if not found; 'DD-MM-YYYY' or 'YYYY-YYYY' when possible).
+"""
+)
 
-    prompt = (
-"""You are an IR analyst. I will provide you the content of an IR file. Your task is:
+SYSTEM_PROMPT = (
+    "You are an IR analyst. The input is the content of one IR file.\n"
+    + FIELD_RULES
+    + "Return only JSON with keys: state,location,department,audit_conducted_year,financial_year."
+)
 
-1. Identify the following details from the IR file:
-   - State = Name of the Indian state (return 'Unknown' if not found).
-   - Location = Clean town/city/taluka name (avoid full addresses, return 'Unknown' if not found).
-   - Department = Only one overall department, always ending with 'Department' (return 'Unknown Department' if not found).
-   - Audit Conducted Year = The **Date of Audit** (must be present in the Scope of Audit section, return 'Unviable' if not found, formats 'DD-MM-YYYY' or 'YYYY-YYYY' when possible).
-   - Financial Year = The **Period of Audit / Reporting Period** (must be present in the Headings or Scope of Audit section, return 'Unviable' if not found, formats 'DD-MM-YYYY' or 'YYYY-YYYY' when possible).
+BATCH_SYSTEM_PROMPT = (
+    "You are an IR analyst. The input is a JSON array of IR files, each {\"id\",\"text\"}. For every file:\n"
+    + FIELD_RULES
+    + "Return only a JSON array, one object per file in input order, "
+    "with keys: id,state,location,department,audit_conducted_year,financial_year."
+)
 
+UNKNOWN_RESULT = ("Unknown", "Unknown", "Unknown Department", "Unknown", "Unknown")
 
-Return only a valid JSON object with exactly these 5 keys:
+def field_value(parsed, name, default):
+    """Return ``parsed[name]`` as a stripped string; null or missing values give ``default``."""
+    value = parsed.get(name)
+    if value is None:
+        return default
+    return str(value).strip()
 
-{
-  "state": "...",
-  "location": "...",
-  "department": "...",
-  "audit_conducted_year": "...",
-  "financial_year": "..."
-}
-"""
+def parse_fields(parsed):
+    state = field_value(parsed, "state", "Unknown")
+    location = clean_location(field_value(parsed, "location", "Unknown"))
+    department = field_value(parsed, "department", "Unknown Department")
+    audit_year = field_value(parsed, "audit_conducted_year", "Unknown")
+    financial_year = field_value(parsed, "financial_year", "Unknown")
+    return state, location, department, audit_year, financial_year
 
-    )
+def find_json_span(content, opener):
+    """Return the first balanced JSON object/array starting with ``opener``, in one forward scan.
+
+    Scanning starts after any ``</think>`` block so braces in the model's
+    reasoning are ignored; brackets inside JSON strings are skipped.
+    """
+    start = content.find(opener, content.rfind("</think>") + 1)
+    if start == -1:
+        return None
+    depth, in_string, escaped = 0, False, False
+    for pos in range(start, len(content)):
+        ch = content[pos]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return content[start:pos + 1]
+    return None
 
+def parse_json_response(content, opener):
+    """Parse the response as JSON, falling back to the first balanced span starting with ``opener``."""
     try:
-        response = llm.invoke([
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": doc_text}
-        ])
-        content = response.content.strip()
-        logger.info("Received raw response from Groq API: %s", content)
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        span = find_json_span(content, opener)
+        if span is None:
+            return None
+        return orjson.loads(span)
 
-        try:
-            parsed = json.loads(content)
-            state = parsed.get("state", "Unknown").strip()
-            location = clean_location(parsed.get("location", "Unknown").strip())
-            department = parsed.get("department", "Unknown Department").strip()
-            audit_year = parsed.get("audit_conducted_year", "Unknown").strip()
-            financial_year = parsed.get("financial_year", "Unknown").strip()
-            return state, location, department, audit_year, financial_year
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
-                state = parsed.get("state", "Unknown").strip()
-                location = clean_location(parsed.get("location", "Unknown").strip())
-                department = parsed.get("department", "Unknown Department").strip()
-                audit_year = parsed.get("audit_conducted_year", "Unknown").strip()
-                financial_year = parsed.get("financial_year", "Unknown").strip()
-                return state, location, department, audit_year, financial_year
-            return "Unknown", "Unknown", "Unknown Department", "Unknown", "Unknown"
+def signature_matches(doc_text, result):
+    """A similar document's answer is only reused if every one of its fields appears in this one.
+
+    Near-duplicate IRs share a template but usually differ in location and
+    audit/financial years, so all five values must be found in ``doc_text``.
+    """
+    state, location, department, audit_year, financial_year = result
+    if not all(result) or "Unknown" in (state, location, audit_year, financial_year) or department == "Unknown Department":
+        return False
+    if "Unviable" in (audit_year, financial_year):
+        return False
+    text = doc_text.lower()
+    department_name = _DEPARTMENT_SUFFIX_RE.sub("", department)
+    return all(value.lower() in text for value in (state, location, department_name, audit_year, financial_year))
+
+def lookup_batch(texts, cache, semantic_cache):
+    """Return ``(result, key, vec)`` per text; ``result`` is None on a cache miss.
+
+    Blocking (SQLite reads, one embedding call for all misses), so it runs on
+    the cache thread rather than the event loop.
+    """
+    entries, misses = [], []
+    for text in texts:
+        key = hash_request(MODEL, SYSTEM_PROMPT, text)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Cache hit for request %s", key[:12])
+            entries.append((tuple(cached), key, None))
+        else:
+            misses.append((len(entries), text, key))
+            entries.append(None)
+
+    if misses:
+        vecs = semantic_cache.embed([text for _, text, _ in misses])
+        for row, (j, text, key) in enumerate(misses):
+            vec = vecs[row:row + 1]
+            similar = semantic_cache.get(vec)
+            if similar is not None and signature_matches(text, similar):
+                logger.info("Semantic cache hit for request %s", key[:12])
+                entries[j] = (tuple(similar), key, vec)
+            else:
+                entries[j] = (None, key, vec)
+    return entries
+
+def store_results(answered, cache, semantic_cache):
+    """Persist ``(key, vec, result)`` triples in both caches; runs on the cache thread."""
+    for key, vec, result in answered:
+        cache.set(key, list(result))
+        semantic_cache.set(vec, list(result))
+
+async def analyze_ir_content_async(llm, doc_text, sem):
+    """Analyze a single document; returns None if no usable answer was received."""
+    try:
+        parsed = parse_json_response(await llm.query(SYSTEM_PROMPT, doc_text, sem), "{")
+        if parsed is None:
+            return None
+        return parse_fields(parsed)
     except Exception as e:
         logger.error(f"Groq API error: {str(e)}")
-        return "Unknown", "Unknown", "Unknown Department", "Unknown", "Unknown"
+        return None
 
-def main_process():
-    rows = []
-    docx_files = [f for f in os.listdir(MY_DOCS_FOLDER) if f.lower().endswith('.docx')]
-    if not docx_files:
-        logger.warning(f"No .docx files found in {MY_DOCS_FOLDER}")
-        pd.DataFrame([{
-            "Filename": "",
-            "State": "",
-            "Location": "",
-            "Department": "",
-            "Audit Conducted Year": "",
-            "Financial Year": ""
-        }]).to_excel(RESULTS_FILE, index=False, engine='openpyxl')
-        return
+async def analyze_ir_batch_async(texts, llm, sem, cache, semantic_cache, cache_executor):
+    """Analyze a batch of documents with one Groq request.
+
+    Cached documents are answered locally. If the batch response arrives but
+    does not cover every document, the rest are retried individually; if the
+    request itself fails (e.g. still rate limited after MAX_RETRIES), the
+    batch is left unanswered rather than fanned out into more requests.
+
+    Returns one result per text, or None where no answer was obtained
+    (unreadable document or failed request).
+    """
+    loop = asyncio.get_running_loop()
+    results = [None] * len(texts)
+    indices = [i for i, text in enumerate(texts) if text]
+    entries = await loop.run_in_executor(
+        cache_executor, lookup_batch, [texts[i] for i in indices], cache, semantic_cache
+    )
+    pending = []
+    for i, (cached, key, vec) in zip(indices, entries):
+        text = texts[i]
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append((i, text, key, vec))
+
+    answers = {}
+    batch_failed = False
+    if len(pending) > 1:
+        payload = orjson.dumps(
+            [{"id": f"doc{n}", "text": text} for n, (_, text, _, _) in enumerate(pending)]
+        ).decode()
+        try:
+            content = await llm.query(BATCH_SYSTEM_PROMPT, payload, sem)
+        except Exception as e:
+            logger.error(f"Groq API error for a batch of {len(pending)} files: {str(e)}")
+            batch_failed = True
+        else:
+            try:
+                parsed = parse_json_response(content, "[")
+            except Exception as e:
+                logger.warning(f"Could not parse batch response: {str(e)}")
+                parsed = None
+            if not isinstance(parsed, list):
+                parsed = []
+            # Parse items one by one so a malformed item only sends its own
+            # document to the single-document fallback.
+            for item in parsed:
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    answers[item.get("id")] = parse_fields(item)
+                except Exception as e:
+                    logger.warning(f"Could not parse batch item {item.get('id')!r}: {str(e)}")
+
+    missing = [] if batch_failed else [n for n in range(len(pending)) if f"doc{n}" not in answers]
+    if missing and len(pending) > 1:
+        logger.warning(f"Batch response covered {len(pending) - len(missing)}/{len(pending)} files, retrying the rest individually")
+    retried = await asyncio.gather(*[analyze_ir_content_async(llm, pending[n][1], sem) for n in missing])
+    for n, result in zip(missing, retried):
+        answers[f"doc{n}"] = result
+
+    answered = []
+    for n, (i, _, key, vec) in enumerate(pending):
+        result = answers.get(f"doc{n}")
+        if result is None:
+            continue
+        answered.append((key, vec, result))
+        results[i] = result
+    if answered:
+        await loop.run_in_executor(cache_executor, store_results, answered, cache, semantic_cache)
+    return results
 
-    logger.info(f"Found {len(docx_files)} .docx files in {MY_DOCS_FOLDER}")
+async def process_batch(pool, cache_executor, fpaths, llm, sem, cache, semantic_cache, checkpoint):
+    """Analyze one batch and checkpoint its rows; returns the number of failed files.
 
-    for root, _, files in os.walk(MY_DOCS_FOLDER):
-        for fname in tqdm(files, desc=f"Processing files"):
-            if not fname.lower().endswith(".docx"):
-                continue
+    Failed files are written with ``"ok": false`` so that a rerun retries them.
+    Rows are keyed by ``"Path"``, relative to MY_DOCS_FOLDER, because files in
+    different subfolders may share a basename.
+    """
+    texts = await extract_texts(pool, fpaths)
+    results = await analyze_ir_batch_async(texts, llm, sem, cache, semantic_cache, cache_executor)
+    for fpath, result in zip(fpaths, results):
+        state, location, department, audit_year, financial_year = result or UNKNOWN_RESULT
+        checkpoint.write(orjson.dumps({
+            "Filename": os.path.basename(fpath),
+            "Path": os.path.relpath(fpath, MY_DOCS_FOLDER),
+            "State": state,
+            "Location": location,
+            "Department": department,
+            "Audit Conducted Year": audit_year,
+            "Financial Year": financial_year,
+            "ok": result is not None
+        }) + b"\n")
+    checkpoint.flush()
+    return results.count(None)
 
-            fpath = os.path.join(root, fname)
-            text = extract_text_from_docx(fpath)
-            state, location, department, audit_year, financial_year = analyze_ir_content(text)
+def load_checkpoint():
+    """Return the rows already in CHECKPOINT_FILE.
 
-            rows.append({
-                "Filename": fname,
-                "State": state,
-                "Location": location,
-                "Department": department,
-                "Audit Conducted Year": audit_year,
-                "Financial Year": financial_year
-            })
+    If a crash left a torn last line, the file is rewritten with only the
+    readable rows so that new rows can be appended safely.
+    """
+    if not os.path.exists(CHECKPOINT_FILE):
+        return []
+    rows, torn = [], False
+    with open(CHECKPOINT_FILE, "rb") as checkpoint:
+        for line in checkpoint:
+            torn = torn or not line.endswith(b"\n")
+            try:
+                rows.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                torn = True
+    if torn:
+        logger.warning(f"Repairing {CHECKPOINT_FILE} after an interrupted write")
+        with open(CHECKPOINT_FILE, "wb") as checkpoint:
+            checkpoint.writelines(orjson.dumps(row) + b"\n" for row in rows)
+    return rows
 
-            df = pd.DataFrame(rows)
-            df.to_excel(RESULTS_FILE, index=False, engine='openpyxl')
+def row_key(row):
+    """Return the file a checkpoint row belongs to; older rows only have a basename."""
+    return row.get("Path", row["Filename"])
 
-    if not rows:
-        pd.DataFrame(columns=["Filename", "State", "Location", "Department", "Audit Conducted Year", "Financial Year"]).to_excel(
-            RESULTS_FILE, index=False, engine='openpyxl'
+def latest_rows(rows):
+    """Keep only the most recent row per file; retried files are appended again."""
+    return list({row_key(row): row for row in rows}.values())
+
+async def main_process(llm, cache, semantic_cache):
+    fpaths = list(iter_docx(MY_DOCS_FOLDER))
+    if not fpaths:
+        logger.warning(f"No .docx files found in {MY_DOCS_FOLDER}")
+        pd.DataFrame([dict.fromkeys(RESULT_COLUMNS, "")]).to_excel(RESULTS_FILE, index=False, engine='xlsxwriter')
+        return
+
+    logger.info(f"Found {len(fpaths)} .docx files in {MY_DOCS_FOLDER}")
+
+    done = {row_key(row) for row in latest_rows(load_checkpoint()) if row.get("ok", True)}
+    if done:
+        fpaths = [fpath for fpath in fpaths if os.path.relpath(fpath, MY_DOCS_FOLDER) not in done]
+        logger.info(f"Resuming: {len(done)} files already in {CHECKPOINT_FILE}, {len(fpaths)} left (delete it to start over)")
+
+    # Each batch is parsed in the process pool and sent to the LLM as soon as
+    # its documents are ready, so parsing overlaps with in-flight requests.
+    # Cache lookups, embeddings and cache writes run on a single thread so
+    # they neither block the event loop nor touch SQLite/FAISS concurrently.
+    # Results are appended to the JSONL checkpoint as each batch completes.
+    workers = max(1, (os.cpu_count() or 2) - 1)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            ThreadPoolExecutor(max_workers=1) as cache_executor, \
+            open(CHECKPOINT_FILE, "ab") as checkpoint:
+        failed = await tqdm_asyncio.gather(
+            *[
+                process_batch(pool, cache_executor, fpaths[i:i + BATCH_SIZE], llm, sem, cache, semantic_cache, checkpoint)
+                for i in range(0, len(fpaths), BATCH_SIZE)
+            ],
+            desc="Processing batches"
         )
 
+    if sum(failed):
+        logger.warning(f"{sum(failed)} files could not be analyzed; rerun the script to retry them")
+
+    pd.DataFrame(latest_rows(load_checkpoint()), columns=RESULT_COLUMNS).to_excel(
+        RESULTS_FILE, index=False, engine='xlsxwriter'
+    )
+
     logger.info(f"✅ Processing complete. Results saved in {RESULTS_FILE}")
 
 # ---------- MAIN ----------
 if __name__ == "__main__":
+    setup_logging()
+
+    if not os.path.exists(MY_DOCS_FOLDER):
+        logger.error(f"Directory {MY_DOCS_FOLDER} does not exist.")
+        raise FileNotFoundError(f"Directory {MY_DOCS_FOLDER} does not exist.")
+
+    llm = init_llm()
+    cache = ResponseCache(CACHE_FILE)
+    semantic_cache = SemanticCache(CACHE_FILE, model_name=EMBEDDING_MODEL, threshold=SEMANTIC_CACHE_THRESHOLD)
+
     try:
         if not os.path.exists(RESULTS_FILE):
-            pd.DataFrame(columns=["Filename", "State", "Location", "Department", "Audit Conducted Year", "Financial Year"]).to_excel(
-                RESULTS_FILE, index=False, engine='openpyxl'
+            pd.DataFrame(columns=RESULT_COLUMNS).to_excel(
+                RESULTS_FILE, index=False, engine='xlsxwriter'
             )
             logger.info(f"Created empty Excel file: {RESULTS_FILE}")
 
-        main_process()
+        asyncio.run(main_process(llm, cache, semantic_cache))
     except Exception as e:
         logger.error(f"Script failed: {str(e)}")
-        pd.DataFrame([{
-            "Filename": "",
-            "State": "",
-            "Location": "",
-            "Department": "",
-            "Audit Conducted Year": "",
-            "Financial Year": ""
-        }]).to_excel(RESULTS_FILE, index=False, engine='openpyxl')
+        pd.DataFrame([dict.fromkeys(RESULT_COLUMNS, "")]).to_excel(RESULTS_FILE, index=False, engine='xlsxwriter')
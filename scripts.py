@@ -1,5 +1,7 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+import openpyxl
 import pandas as pd
 
 # === Paths ===
@@ -14,17 +16,22 @@ os.makedirs(output_folder, exist_ok=True)
 os.makedirs(unprocessed_folder, exist_ok=True)
 
 # === Step 1: Read input folder files ===
-input_files = [f for f in os.listdir(input_folder) if f.endswith(".docx")]
-input_files_no_ext = [os.path.splitext(f)[0] for f in input_files]
-
-# === Step 2: Read processed files from results.xlsx ===
-df = pd.read_excel(results_file)
-processed_files = df.iloc[:, 0].astype(str).tolist()
-processed_files_no_ext = [os.path.splitext(f)[0] for f in processed_files]
+with os.scandir(input_folder) as entries:
+    input_files = [e.name for e in entries if e.is_file() and e.name.endswith(".docx")]
+input_files_no_ext = frozenset(os.path.splitext(f)[0] for f in input_files)
+
+# === Step 2: Read processed files from results.xlsx (first column only) ===
+wb = openpyxl.load_workbook(results_file, read_only=True, data_only=True)
+processed_files_no_ext = frozenset(
+    os.path.splitext(str(row[0]))[0]
+    for row in wb.active.iter_rows(min_row=2, max_col=1, values_only=True)
+    if row[0] is not None
+)
+wb.close()
 
 # === Step 3: Compare lists ===
-missing_in_results = sorted(set(input_files_no_ext) - set(processed_files_no_ext))
-extra_in_results = sorted(set(processed_files_no_ext) - set(input_files_no_ext))
+missing_in_results = sorted(input_files_no_ext - processed_files_no_ext)
+extra_in_results = sorted(processed_files_no_ext - input_files_no_ext)
 
 # === Step 4: Save comparison results ===
 with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
@@ -36,12 +43,17 @@ with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
     )
 
 # === Step 5: Copy unprocessed files to Unprocessed folder ===
-for file in input_files:
-    file_no_ext = os.path.splitext(file)[0]
-    if file_no_ext in missing_in_results:
-        src_path = os.path.join(input_folder, file)
-        dest_path = os.path.join(unprocessed_folder, file)
-        shutil.copy2(src_path, dest_path)  # copy keeps original safe
+missing_set = frozenset(missing_in_results)
+files_to_copy = [f for f in input_files if os.path.splitext(f)[0] in missing_set]
+
+def copy_to_unprocessed(file):
+    src_path = os.path.join(input_folder, file)
+    dest_path = os.path.join(unprocessed_folder, file)
+    shutil.copy2(src_path, dest_path)  # copy keeps original safe
+
+# Copies are I/O-bound, so a few threads overlap the per-file open/read/write syscalls.
+with ThreadPoolExecutor(max_workers=8) as executor:
+    list(executor.map(copy_to_unprocessed, files_to_copy))
 
 print(f"✅ Comparison complete. Results saved to {output_file}")
 print(f"✅ Unprocessed files copied to {unprocessed_folder}")